@@ -4,22 +4,26 @@ from __future__ import annotations
 
 __version__ = "0.9.0"
 
-import argparse
 import glob
+import heapq
 import json
 import os
 import random
 import re
 import select
+import selectors
 import signal
 import subprocess
 import sys
 import termios
+import threading
 import time
 import tty
 from collections import deque
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from datetime import datetime, timedelta
-from pathlib import Path
 from types import SimpleNamespace
 
 import psutil
@@ -28,6 +32,7 @@ from rich.console import Console
 from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
@@ -63,6 +68,88 @@ with warnings.catch_warnings():
     except ImportError:
         _PYNVML = False
 
+# Optional python-systemd: reads the journal in-process instead of running journalctl
+try:
+    from systemd import journal as _journal
+
+    _SYSTEMD_JOURNAL = True
+except ImportError:
+    _SYSTEMD_JOURNAL = False
+
+
+def _sysfs_fd(path: str | None) -> int | None:
+    """Open a sysfs attribute once for repeated pread() polling. None if unavailable."""
+    if not path:
+        return None
+    try:
+        return os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    except OSError:
+        return None
+
+
+def _pread_int(fd: int) -> int:
+    """Re-read an integer sysfs attribute from offset 0 (one syscall, no open/close)."""
+    return int(os.pread(fd, 32, 0))
+
+
+def _close_fd(fd: int | None) -> None:
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+_AMD_FD_KEYS = ("util_fd", "vram_used_fd", "temp_fd", "power_fd", "power_cap_fd")
+
+
+def _close_amd_fds(cards: list[dict]) -> None:
+    for card in cards:
+        for key in _AMD_FD_KEYS:
+            _close_fd(card.get(key))
+            card[key] = None
+
+
+# hwmon chip names read for the temperature strip, in psutil.sensors_temperatures() terms
+_CPU_SENSORS = ("coretemp", "k10temp", "cpu_thermal", "zenpower", "acpitz")
+_MEM_SENSORS = ("SODIMM", "dimm", "memory")
+
+
+def _read_opt_int(path: str) -> int | None:
+    try:
+        with open(path) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def _detect_hwmon_temps() -> list[tuple[str, int, float | None, float | None]]:
+    """Find CPU/memory temperature inputs in /sys/class/hwmon once.
+
+    Returns (chip name, open temp*_input fd, high °C, critical °C) per sensor,
+    mirroring what psutil.sensors_temperatures() would report for those chips.
+    """
+    bases = glob.glob("/sys/class/hwmon/hwmon*/temp*_input")
+    bases.extend(glob.glob("/sys/class/hwmon/hwmon*/device/temp*_input"))
+    sensors = []
+    for input_path in sorted(set(bases)):
+        base = input_path[:-len("_input")]
+        try:
+            with open(os.path.join(os.path.dirname(base), "name")) as f:
+                chip = f.read().strip()
+        except OSError:
+            continue
+        if chip not in _CPU_SENSORS and chip not in _MEM_SENSORS:
+            continue
+        fd = _sysfs_fd(input_path)
+        if fd is None:
+            continue
+        # Limits are fixed by the chip; only the input is polled
+        high = _read_opt_int(base + "_max")
+        crit = _read_opt_int(base + "_crit")
+        sensors.append((chip, fd, high / 1000 if high else None, crit / 1000 if crit else None))
+    return sensors
+
 
 def _detect_amd_gpus() -> list[dict]:
     """Scan sysfs for AMD GPUs (vendor 0x1002). Returns list of cached card info dicts."""
@@ -150,6 +237,11 @@ def _detect_amd_gpus() -> list[dict]:
             except OSError:
                 pass
 
+        # Critical temperature is fixed by the board: read it once (°C, None if unreported)
+        temp_crit = _read_opt_int(temp_crit_path) if temp_crit_path else None
+        if temp_crit is not None:
+            temp_crit /= 1000
+
         cards.append({
             "dev_dir": dev_dir,
             "name": name,
@@ -161,8 +253,15 @@ def _detect_amd_gpus() -> list[dict]:
             "vram_total_bytes": vram_total_bytes,
             "temp_path": temp_path,
             "temp_crit_path": temp_crit_path,
+            "temp_crit": temp_crit,
             "power_path": power_path,
             "power_cap_path": power_cap_path,
+            # Polled attributes stay open; sysfs regenerates the value on each pread at offset 0
+            "util_fd": _sysfs_fd(util_path) if has_util else None,
+            "vram_used_fd": _sysfs_fd(vram_used_path) if has_vram else None,
+            "temp_fd": _sysfs_fd(temp_path),
+            "power_fd": _sysfs_fd(power_path),
+            "power_cap_fd": _sysfs_fd(power_cap_path),
         })
     return cards
 
@@ -171,8 +270,17 @@ def _detect_amd_gpus() -> list[dict]:
 SPARK = " ▁▂▃▄▅▆▇█"
 SPARK_DOWN = " ▔\U0001FB82\U0001FB83▀\U0001FB84\U0001FB85\U0001FB86█"
 HISTORY_LEN = 300
-CONFIG_DIR = Path.home() / ".config" / "ktop"
-CONFIG_FILE = CONFIG_DIR / "config.json"
+MIN_REFRESH = 0.1  # seconds; shortest sampler period accepted from -r
+GPU_SAMPLE_INTERVAL = 0.5  # seconds; NVML/sysfs GPU queries are capped at this rate
+REDRAW_INTERVAL = 5.0  # seconds; full repaint even when no panel changed
+TEMP_SAMPLE_INTERVAL = 4.0  # seconds; temperature strip readings change slowly
+MEM_SAMPLE_INTERVAL = 1.0  # seconds; RAM/swap readings (matters only with sub-second refresh)
+SENSOR_RESCAN_INTERVAL = 60.0  # seconds; re-resolve hwmon sensors (driver reloads)
+OOM_CHECK_INTERVAL = 5.0  # seconds; journalctl queries for OOM kills
+STATM_EVERY = 3  # process scans between re-reads of a displayed process's shared memory
+# Plain os.path: pathlib (and the urllib.parse it pulls in) costs ~4ms at startup
+CONFIG_DIR = os.path.join(os.path.expanduser("~"), ".config", "ktop")
+CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
 
 # PCIe theoretical max bandwidth per lane in KB/s (base 1000)
 # Formulas: (GT/s * EncodingEfficiency) / 8 bits_per_byte * 10^6 KB_per_GB
@@ -271,19 +379,35 @@ THEME_NAMES = list(THEMES.keys())
 # ── config persistence ───────────────────────────────────────────────────────
 def _load_config() -> dict:
     try:
-        return json.loads(CONFIG_FILE.read_text())
+        with open(CONFIG_FILE) as f:
+            return json.load(f)
     except Exception:
         return {}
 
 
 def _save_config(cfg: dict) -> None:
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(json.dumps(cfg, indent=2) + "\n")
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+    with open(CONFIG_FILE, "w") as f:
+        f.write(json.dumps(cfg, indent=2) + "\n")
 
 
 # ── helpers ──────────────────────────────────────────────────────────────────
 _rgb_cache: dict[str, tuple[int, int, int]] = {}
 
+# Prebuilt styles: passing Style objects to Text.append skips markup and style parsing
+_STYLE_BOLD = Style(bold=True)
+_STYLE_DIM = Style(dim=True)
+_STYLE_BOLD_DIM = Style(bold=True, dim=True)
+_style_cache: dict[str, Style] = {}
+
+
+def _style(color: str) -> Style:
+    """Foreground Style for a Rich color name or hex string. Cached."""
+    st = _style_cache.get(color)
+    if st is None:
+        st = _style_cache[color] = Style(color=color)
+    return st
+
 
 def _color_to_rgb(name: str) -> tuple[int, int, int]:
     """Parse a Rich color name or hex string to (r, g, b). Cached."""
@@ -301,24 +425,36 @@ def _lerp_rgb(c1: tuple[int, int, int], c2: tuple[int, int, int], t: float) -> s
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
-def _bar(pct: float, width: int = 25, theme: dict | None = None) -> str:
-    """Render a smooth gradient progress bar as Rich markup."""
-    filled = int(pct / 100 * width)
-    empty = width - filled
-    rgb_lo = _color_to_rgb(theme["bar_low"] if theme else "green")
-    rgb_hi = _color_to_rgb(theme["bar_high"] if theme else "red")
+def _bar(pct: float, width: int = 25, theme: dict | None = None) -> Text:
+    """Render a smooth gradient progress bar as styled Text. Cached; callers append a copy."""
+    lo = theme["bar_low"] if theme else "green"
+    hi = theme["bar_high"] if theme else "red"
+    # Clamp: a negative fill would slice the ramp from the end
+    filled = max(0, min(int(pct / 100 * width), width))
+    return _bar_text(filled, width, lo, hi)
+
+
+# Finished bars keyed by (filled, width, low color, high color). Bounded, since
+# every terminal width seen while resizing adds up to width+1 entries
+@lru_cache(maxsize=4096)
+def _bar_text(filled: int, width: int, lo: str, hi: str) -> Text:
+    bar = Text()
+    for st in _bar_ramp(width, lo, hi)[:filled]:
+        bar.append("█", st)
+    if width - filled > 0:
+        bar.append("░" * (width - filled), _STYLE_DIM)
+    return bar
 
-    parts = []
-    for i in range(filled):
-        t = i / max(width - 1, 1)
-        c = _lerp_rgb(rgb_lo, rgb_hi, t)
-        parts.append(f"[{c}]█[/{c}]")
-    if empty:
-        parts.append(f"[dim]{'░' * empty}[/dim]")
-    return "".join(parts)
 
+@lru_cache(maxsize=256)
+def _bar_ramp(width: int, lo: str, hi: str) -> tuple[Style, ...]:
+    """Per-cell gradient styles for a bar of this width; shared by every fill level."""
+    rgb_lo = _color_to_rgb(lo)
+    rgb_hi = _color_to_rgb(hi)
+    return tuple(_style(_lerp_rgb(rgb_lo, rgb_hi, i / max(width - 1, 1))) for i in range(width))
 
-def _simplex_bar(rx_pct: float, tx_pct: float, width: int = 25, theme: dict | None = None) -> str:
+
+def _simplex_bar(rx_pct: float, tx_pct: float, width: int = 25, theme: dict | None = None) -> Text:
     """Render a dual-ended bar: RX from left, TX from right."""
     w_rx = int(min(rx_pct, 100.0) / 100 * width)
     w_tx = int(min(tx_pct, 100.0) / 100 * width)
@@ -334,81 +470,102 @@ def _simplex_bar(rx_pct: float, tx_pct: float, width: int = 25, theme: dict | No
     c_rx = theme["net_down"] if theme else "cyan"
     c_tx = theme["net_up"] if theme else "magenta"
 
-    return f"[{c_rx}]{'█' * w_rx}[/{c_rx}][dim]{'░' * w_idle}[/dim][{c_tx}]{'█' * w_tx}[/{c_tx}]"
+    return Text.assemble(("█" * w_rx, _style(c_rx)), ("░" * w_idle, _STYLE_DIM), ("█" * w_tx, _style(c_tx)))
+
+
+# Threshold key for each whole percent: <50 low, <80 mid, else high
+_COLOR_KEYS = tuple("bar_low" if i < 50 else "bar_mid" if i < 80 else "bar_high" for i in range(101))
+_DEFAULT_COLORS = {"bar_low": "green", "bar_mid": "yellow", "bar_high": "red"}
 
 
 def _color_for(pct: float, theme: dict | None = None) -> str:
-    if theme:
-        if pct < 50:
-            return theme["bar_low"]
-        if pct < 80:
-            return theme["bar_mid"]
-        return theme["bar_high"]
-    if pct < 50:
-        return "green"
-    if pct < 80:
-        return "yellow"
-    return "red"
+    key = _COLOR_KEYS[min(100, max(0, int(pct)))]
+    return (theme or _DEFAULT_COLORS)[key]
+
+
+def _spark_glyph(v: float) -> str:
+    v = max(0.0, min(100.0, v))
+    if v <= 5.0:
+        return SPARK[0]  # space for ≤5%
+    # Map 5–100% onto indices 1–8
+    idx = 1 + int((v - 5.0) / 95.0 * (len(SPARK) - 2))
+    return SPARK[min(idx, len(SPARK) - 1)]
+
+
+def _spark_double_glyphs(v: float) -> tuple[str, str]:
+    """(top, bottom) glyphs for a double-height sparkline with 16 levels."""
+    v = max(0.0, min(100.0, v))
+    n = len(SPARK) - 1  # 8 levels per row
+    level = min(int(v / 100 * (2 * n)), 2 * n)
+    if level <= n:
+        # Bottom row only
+        return SPARK[0], SPARK[level]
+    # Bottom full, top gets the overflow
+    return SPARK[level - n], SPARK[n]
+
+
+def _spark_down_glyph(v: float) -> str:
+    v = max(0.0, min(100.0, v))
+    return SPARK_DOWN[int(v / 100 * (len(SPARK_DOWN) - 1))]
+
+
+def _spark_table(glyph) -> tuple:
+    """Precompute glyph(v) for every 0.1% bucket of 0–100.
+
+    Buckets that straddle a level boundary are stored as None so callers
+    fall back to glyph(v) and the output stays exact.
+    """
+    table = []
+    for i in range(1001):
+        g = glyph(i / 10)
+        table.append(g if i == 1000 or g == glyph((i + 1) / 10 - 1e-9) else None)
+    return tuple(table)
+
+
+_SPARK_LUT = _spark_table(_spark_glyph)
+_SPARK_DOUBLE_LUT = _spark_table(_spark_double_glyphs)
+_SPARK_DOWN_LUT = _spark_table(_spark_down_glyph)
+
+
+def _spark_tail(values, width: int | None):
+    """Iterate the last `width` values without copying the whole history."""
+    n = len(values)
+    if width and n > width:
+        return islice(values, n - width, None)
+    return values
 
 
 def _sparkline(values, width: int | None = None) -> str:
     if not values:
         return ""
-    vals = list(values)
-    if width and len(vals) > width:
-        vals = vals[-width:]
-    out = []
-    for v in vals:
-        v = max(0.0, min(100.0, v))
-        if v <= 5.0:
-            idx = 0  # space for ≤5%
-        else:
-            # Map 5–100% onto indices 1–8
-            idx = 1 + int((v - 5.0) / 95.0 * (len(SPARK) - 2))
-            idx = min(idx, len(SPARK) - 1)
-        out.append(SPARK[idx])
-    return "".join(out)
+    lut = _SPARK_LUT
+    return "".join([
+        lut[0 if v <= 0 else 1000 if v >= 100 else int(v * 10)] or _spark_glyph(v)
+        for v in _spark_tail(values, width)
+    ])
 
 
 def _sparkline_double(values, width: int | None = None) -> tuple[str, str]:
     """Double-height sparkline: returns (top_row, bottom_row) with 16 levels."""
     if not values:
         return "", ""
-    vals = list(values)
-    if width and len(vals) > width:
-        vals = vals[-width:]
-    n = len(SPARK) - 1  # 8 levels per row
-    top = []
-    bot = []
-    for v in vals:
-        v = max(0.0, min(100.0, v))
-        # Map to 0–16 (2*n) levels
-        level = int(v / 100 * (2 * n))
-        level = min(level, 2 * n)
-        if level <= n:
-            # Bottom row only
-            top.append(SPARK[0])
-            bot.append(SPARK[level])
-        else:
-            # Bottom full, top gets the overflow
-            bot.append(SPARK[n])
-            top.append(SPARK[level - n])
-    return "".join(top), "".join(bot)
+    lut = _SPARK_DOUBLE_LUT
+    pairs = [
+        lut[0 if v <= 0 else 1000 if v >= 100 else int(v * 10)] or _spark_double_glyphs(v)
+        for v in _spark_tail(values, width)
+    ]
+    return "".join([p[0] for p in pairs]), "".join([p[1] for p in pairs])
 
 
 def _sparkline_down(values, width: int | None = None) -> str:
     """Sparkline with blocks extending downward from the top."""
     if not values:
         return ""
-    vals = list(values)
-    if width and len(vals) > width:
-        vals = vals[-width:]
-    out = []
-    for v in vals:
-        v = max(0.0, min(100.0, v))
-        idx = int(v / 100 * (len(SPARK_DOWN) - 1))
-        out.append(SPARK_DOWN[idx])
-    return "".join(out)
+    lut = _SPARK_DOWN_LUT
+    return "".join([
+        lut[0 if v <= 0 else 1000 if v >= 100 else int(v * 10)] or _spark_down_glyph(v)
+        for v in _spark_tail(values, width)
+    ])
 
 
 def _fmt_pcie_pair(rx_b, tx_b) -> tuple[str, str, str]:
@@ -433,15 +590,21 @@ def _fmt_bytes(b: float) -> str:
     return f"{mb:.1f} MB"
 
 
+# (divisor, unit) indexed by (bit_length - 1) // 10, i.e. by power of 1024
+_SPEED_UNITS = ((1, "B/s"), (1024, "KB/s"), (1024**2, "MB/s"), (1024**3, "GB/s"))
+
+
 def _fmt_speed(b: float) -> str:
     """Format bytes/sec as human-readable speed."""
-    if b >= 1024**3:
-        return f"{b / 1024**3:.1f} GB/s"
-    if b >= 1024**2:
-        return f"{b / 1024**2:.1f} MB/s"
-    if b >= 1024:
-        return f"{b / 1024:.1f} KB/s"
-    return f"{b:.0f} B/s"
+    if b < 1024:
+        return f"{b:.0f} B/s"
+    div, unit = _SPEED_UNITS[min(3, (int(b).bit_length() - 1) // 10)]
+    return f"{b / div:.1f} {unit}"
+
+
+# Top-N keys for process records (C-level, no per-call closure)
+_BY_MEM_PCT = itemgetter("memory_percent")
+_BY_CPU_PCT = itemgetter("cpu_percent")
 
 
 # ── keyboard input ───────────────────────────────────────────────────────────
@@ -477,7 +640,7 @@ def _read_key() -> str | None:
 # ── main monitor ─────────────────────────────────────────────────────────────
 class KTop:
     def __init__(self, refresh: float = 1.0, sim: bool = False):
-        self.refresh = refresh
+        self.refresh = max(MIN_REFRESH, refresh)
         self.sim = sim
         self.console = Console()
 
@@ -486,13 +649,14 @@ class KTop:
         theme_name = cfg.get("theme", "Vaporwave")
         if theme_name not in THEMES:
             theme_name = "Default"
-        self.theme_name = theme_name
-        self.theme = THEMES[self.theme_name]
+        self._set_theme(theme_name)
 
         # theme picker state
         self.picking_theme = False
         self.theme_cursor = THEME_NAMES.index(self.theme_name)
         self.theme_scroll = 0
+        # (scroll, cursor, theme_name) -> picker layout; those are its only inputs
+        self._picker_cache: tuple[tuple, Layout] | None = None
 
         # rolling histories
         self.cpu_hist: deque[float] = deque(maxlen=HISTORY_LEN)
@@ -501,9 +665,8 @@ class KTop:
         self.net_up_hist: deque[float] = deque(maxlen=HISTORY_LEN)
         self.net_down_hist: deque[float] = deque(maxlen=HISTORY_LEN)
         self.net_max_speed: float = 1.0  # auto-scale ceiling in bytes/sec
-        counters = psutil.net_io_counters()
-        self._last_net_sent = counters.bytes_sent
-        self._last_net_recv = counters.bytes_recv
+        self._net_fd = _sysfs_fd("/proc/net/dev")
+        self._last_net_sent, self._last_net_recv = self._net_totals()
         self._last_net_time = time.monotonic()
 
         # GPU init
@@ -515,11 +678,41 @@ class KTop:
         self.gpu_pcie_rx_hist: dict[int, deque] = {}
         self.gpu_power_hist: dict[int, deque] = {}
         self.gpu_temp_hist: dict[int, deque] = {}
+        # NVML handles and names never change while the driver is loaded;
+        # None for a GPU whose handle lookup failed at startup
+        self._nvml_handles: list = []
+        self._nvml_names: list[str | None] = []
+        # Slowdown temperature is a board constant; None where the driver doesn't report it
+        self._nvml_slowdown: list[float | None] = []
+        # Last memory reading per GPU, reused while the GPU is idle
+        self._nvml_mem: list = []
+        self._nvml_mem_age: list[int] = []
 
         if _PYNVML:
             try:
                 nvmlInit()
                 self.nvidia_gpu_count = nvmlDeviceGetCount()
+                for i in range(self.nvidia_gpu_count):
+                    # A GPU that fell off the bus fails here; keep its slot (None)
+                    # so device indices and histories still line up
+                    try:
+                        h = nvmlDeviceGetHandleByIndex(i)
+                        name = nvmlDeviceGetName(h)
+                        if isinstance(name, bytes):
+                            name = name.decode()
+                    except Exception:
+                        h = name = None
+                    slowdown = None
+                    if h is not None:
+                        try:
+                            slowdown = nvmlDeviceGetTemperatureThreshold(h, NVML_TEMPERATURE_THRESHOLD_SLOWDOWN)
+                        except Exception:
+                            pass
+                    self._nvml_handles.append(h)
+                    self._nvml_names.append(name)
+                    self._nvml_slowdown.append(slowdown)
+                    self._nvml_mem.append(None)
+                    self._nvml_mem_age.append(0)
                 self.nvidia_ok = True
                 for i in range(self.nvidia_gpu_count):
                     self.gpu_util_hist[i] = deque(maxlen=HISTORY_LEN)
@@ -529,7 +722,14 @@ class KTop:
                     self.gpu_power_hist[i] = deque(maxlen=HISTORY_LEN)
                     self.gpu_temp_hist[i] = deque(maxlen=HISTORY_LEN)
             except Exception:
-                pass
+                # Keep AMD indices and gpu_count consistent if NVML setup failed midway
+                if not self.nvidia_ok:
+                    self.nvidia_gpu_count = 0
+                    self._nvml_handles = []
+                    self._nvml_names = []
+                    self._nvml_slowdown = []
+                    self._nvml_mem = []
+                    self._nvml_mem_age = []
 
         # AMD GPU init (sysfs-based, no dependencies)
         self._amd_cards = _detect_amd_gpus()
@@ -545,32 +745,70 @@ class KTop:
         self.gpu_count = self.nvidia_gpu_count + len(self._amd_cards)
         self.gpu_ok = self.gpu_count > 0
 
+        # CPU/memory temperature sensors (hwmon, re-resolved every SENSOR_RESCAN_INTERVAL)
+        self._hwmon_temps = _detect_hwmon_temps()
+        self._last_sensor_scan = time.monotonic()
+
         # process cache (scanned at most every 5s, read from /proc directly)
         self._procs_by_mem: list[dict] = []
         self._procs_by_cpu: list[dict] = []
+        # Per-pid records reused across scans; only volatile fields are rewritten
+        self._proc_cache: dict[int, dict] = {}
+        self._proc_gen = 0  # bumped on every completed scan
         self._last_proc_scan = 0.0
         self._proc_cpu_prev: dict[int, int] = {}
         self._page_size = os.sysconf("SC_PAGE_SIZE")
         self._clock_ticks = os.sysconf("SC_CLK_TCK")
-        self._num_cpus = os.cpu_count() or 1
 
         # OOM kill tracking
         self._last_oom_check = 0.0
+        # systemd.journal.Reader, opened on first OOM check; False once it has failed
+        self._journal = None
+        # Cursor of the newest journal entry examined, and the newest kill seen
+        self._journal_cursor: str | None = None
+        self._journal_kill: tuple[float, str] | None = None
         self._last_oom_str: str | None = None
+        # Short description of the last failed sample; None once sampling recovers
+        self._sampler_error: str | None = None
 
         # profiling (sim mode only)
-        self._prof_log: Path | None = None
+        self._prof_log: str | None = None
         self._prof_accum: dict[str, list[float]] = {}
         self._prof_last_flush = 0.0
         self._prof_frame = 0
         if self.sim:
-            self._prof_log = Path("/tmp/ktop_profile.log")
-            self._prof_log.write_text(f"ktop profile started {datetime.now().isoformat()}\n")
+            self._prof_log = "/tmp/ktop_profile.log"
+            with open(self._prof_log, "w") as f:
+                f.write(f"ktop profile started {datetime.now().isoformat()}\n")
+            # Collectors and frame builders are timed by swapping in wrappers,
+            # so the normal path calls them directly
+            for name in ("_check_oom", "_sample_temps", "_gpu_info", "_scan_procs",
+                         "_gpu_panels", "_net_panel", "_cpu_panel", "_mem_panel",
+                         "_proc_table", "_temp_strip", "_status_bar"):
+                setattr(self, name, self._timed(name[1:], getattr(self, name)))
 
         # CPU info (static, cache once)
         self._cpu_cores = psutil.cpu_count(logical=True)
+        self._num_cpus = self._cpu_cores or 1  # divisor for system-wide CPU %
         self._cpu_freq_str = "N/A"
         self._last_freq_check = 0.0
+        self._freq_fd = _sysfs_fd("/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq")
+
+        # Layout tree is built once; panels are swapped in with Layout.update()
+        self._layout = self._make_layout()
+        self._last_hashes: dict[str, tuple] = {}
+        # Panels and the per-GPU row are reused across frames; only contents change
+        self._panels: dict[str, Panel] = {}
+        self._gpu_layout: Layout | None = None
+        self._gpu_layout_ids: tuple[int, ...] = ()
+        self._gpu_cells: list[Layout] = []
+        # Set whenever a built frame differs from the last one drawn
+        self._panel_sigs: dict[str, tuple] = {}
+        self._frame_changed = True
+        # console.width asks the tty (ioctl) on every access; panels use this
+        # copy, refreshed on SIGWINCH once run() is up
+        self._term_width = self.console.width
+        self._resized = False
 
         psutil.cpu_percent(interval=None)
 
@@ -589,37 +827,117 @@ class KTop:
                 continue
         self._last_proc_scan = time.monotonic()
 
+        # Sampling runs on a background thread (started in run()); panels only
+        # read self._snapshot and the histories, both guarded by self._lock
+        self._lock = threading.Lock()
+        self._data_ready = threading.Event()
+        # run()'s wake pipe: lets the UI block in select() on stdin and new data at once
+        self._wake_r: int | None = None
+        self._wake_w: int | None = None
+        self._sel: selectors.BaseSelector | None = None
+        self._stop = threading.Event()
+        self._sampler: threading.Thread | None = None
+        # journalctl can take seconds on large journals: OOM checks get their own thread
+        self._oom_thread: threading.Thread | None = None
+        self._snapshot: SimpleNamespace | None = None
+        self._last_gpu_sample = 0.0
+        # Temperatures are sampled every Nth tick (about TEMP_SAMPLE_INTERVAL)
+        self._temp_every = max(1, round(TEMP_SAMPLE_INTERVAL / self.refresh))
+        self._mem_every = max(1, round(MEM_SAMPLE_INTERVAL / self.refresh))
+        self._tick = 0
+        self._sample()
+
     # ── data collectors ──────────────────────────────────────────────────
     def _sample_cpu(self) -> float:
-        pct = psutil.cpu_percent(interval=None)
-        self.cpu_hist.append(pct)
-        return pct
+        return psutil.cpu_percent(interval=None)
+
+    def _sample_cpu_freq(self) -> None:
+        """Refresh the cached CPU frequency string every 5s."""
+        # Refresh frequency every 5s via sysfs (0.02ms vs 9ms for psutil.cpu_freq)
+        now = time.monotonic()
+        if now - self._last_freq_check < 5.0:
+            return
+        self._last_freq_check = now
+        if self._freq_fd is not None:
+            try:
+                self._cpu_freq_str = f"{_pread_int(self._freq_fd) / 1000:.0f} MHz"
+                return
+            except (ValueError, OSError):
+                pass
+        # Fallback to psutil on systems without sysfs cpufreq
+        try:
+            freq = psutil.cpu_freq()
+            if freq:
+                self._cpu_freq_str = f"{freq.current:.0f} MHz"
+        except Exception:
+            pass
+
+    def _net_totals(self) -> tuple[int, int]:
+        """Return (bytes_sent, bytes_recv) summed over all interfaces."""
+        if self._net_fd is not None:
+            try:
+                # "  eth0: rx_bytes rx_packets ... (8 rx fields) tx_bytes ..."; two header lines
+                data = os.pread(self._net_fd, 65536, 0)
+                if len(data) == 65536:
+                    # Hundreds of interfaces (e.g. veths): read on until a short read
+                    chunks = [data]
+                    while len(chunks[-1]) == 65536:
+                        chunks.append(os.pread(self._net_fd, 65536, 65536 * len(chunks)))
+                    data = b"".join(chunks)
+                sent = recv = 0
+                for line in data.splitlines()[2:]:
+                    fields = line.partition(b":")[2].split()
+                    recv += int(fields[0])
+                    sent += int(fields[8])
+                return sent, recv
+            except (OSError, IndexError, ValueError):
+                pass
+        counters = psutil.net_io_counters()
+        return counters.bytes_sent, counters.bytes_recv
 
     def _sample_net(self) -> tuple[float, float]:
         """Sample network and return (upload_bytes_sec, download_bytes_sec)."""
-        counters = psutil.net_io_counters()
+        sent, recv = self._net_totals()
         now = time.monotonic()
         dt = now - self._last_net_time
         if dt <= 0:
             dt = 1.0
-        up = (counters.bytes_sent - self._last_net_sent) / dt
-        down = (counters.bytes_recv - self._last_net_recv) / dt
-        self._last_net_sent = counters.bytes_sent
-        self._last_net_recv = counters.bytes_recv
+        # Totals drop when an interface goes away; show that tick as idle
+        up = max(0, sent - self._last_net_sent) / dt
+        down = max(0, recv - self._last_net_recv) / dt
+        self._last_net_sent = sent
+        self._last_net_recv = recv
         self._last_net_time = now
         # Auto-scale: track max observed speed
         self.net_max_speed = max(self.net_max_speed, up, down, 1.0)
-        self.net_up_hist.append(up)
-        self.net_down_hist.append(down)
         return up, down
 
+    def _rediscover_sensors(self) -> None:
+        """Re-resolve hwmon inputs; a reloaded driver leaves the old fds dead."""
+        old = self._hwmon_temps
+        self._hwmon_temps = _detect_hwmon_temps()
+        for sensor in old:
+            _close_fd(sensor[1])
+
     def _sample_temps(self) -> dict:
         """Collect temperature readings with hardware limits."""
         temps = {"cpu": None, "cpu_max": 100.0, "mem": None, "mem_max": 85.0, "gpus": []}
-        # CPU and memory temps from psutil (includes high/critical thresholds)
+        # CPU and memory temps (includes high/critical thresholds): cached hwmon
+        # inputs when found at startup, otherwise psutil (e.g. thermal zones only)
         try:
-            sensor_temps = psutil.sensors_temperatures()
-            for key in ("coretemp", "k10temp", "cpu_thermal", "zenpower", "acpitz"):
+            if self._hwmon_temps:
+                sensor_temps: dict[str, list] = {}
+                for chip, fd, high, crit in self._hwmon_temps:
+                    try:
+                        current = _pread_int(fd) / 1000  # millidegrees → °C
+                    except (OSError, ValueError):
+                        continue
+                    sensor_temps.setdefault(chip, []).append(
+                        SimpleNamespace(current=current, high=high, critical=crit)
+                    )
+            else:
+                sensor_temps = psutil.sensors_temperatures()
+            for key in _CPU_SENSORS:
                 if key in sensor_temps:
                     for s in sensor_temps[key]:
                         if temps["cpu"] is None or s.current > temps["cpu"]:
@@ -629,7 +947,7 @@ class KTop:
                             temps["cpu_max"] = s.critical
                         elif s.high and s.high > temps["cpu_max"]:
                             temps["cpu_max"] = s.high
-            for key in ("SODIMM", "dimm", "memory"):
+            for key in _MEM_SENSORS:
                 if key in sensor_temps:
                     for s in sensor_temps[key]:
                         if temps["mem"] is None or s.current > temps["mem"]:
@@ -640,30 +958,22 @@ class KTop:
             pass
         # NVIDIA GPU temps + slowdown threshold from pynvml
         if self.nvidia_ok:
-            for i in range(self.nvidia_gpu_count):
+            for h, slowdown in zip(self._nvml_handles, self._nvml_slowdown):
+                if h is None:
+                    temps["gpus"].append(None)
+                    continue
                 try:
-                    h = nvmlDeviceGetHandleByIndex(i)
                     t = nvmlDeviceGetTemperature(h, NVML_TEMPERATURE_GPU)
-                    try:
-                        t_max = nvmlDeviceGetTemperatureThreshold(h, NVML_TEMPERATURE_THRESHOLD_SLOWDOWN)
-                    except Exception:
-                        t_max = 95
+                    t_max = 95 if slowdown is None else slowdown
                     temps["gpus"].append({"temp": t, "max": t_max})
                 except Exception:
                     temps["gpus"].append(None)
         # AMD GPU temps from hwmon
         for card in self._amd_cards:
-            if card["temp_path"]:
+            if card["temp_fd"] is not None:
                 try:
-                    with open(card["temp_path"]) as f:
-                        t = int(f.read().strip()) / 1000  # millidegrees → °C
-                    t_max = 95
-                    if card["temp_crit_path"]:
-                        try:
-                            with open(card["temp_crit_path"]) as f:
-                                t_max = int(f.read().strip()) / 1000
-                        except (OSError, ValueError):
-                            pass
+                    t = _pread_int(card["temp_fd"]) / 1000  # millidegrees → °C
+                    t_max = 95 if card["temp_crit"] is None else card["temp_crit"]
                     temps["gpus"].append({"temp": t, "max": t_max})
                 except (OSError, ValueError):
                     temps["gpus"].append(None)
@@ -675,24 +985,25 @@ class KTop:
         gpus = []
         # NVIDIA GPUs
         if self.nvidia_ok:
-            for i in range(self.nvidia_gpu_count):
+            for i, h in enumerate(self._nvml_handles):
+                if h is None:
+                    continue
                 try:
-                    h = nvmlDeviceGetHandleByIndex(i)
-                    name = nvmlDeviceGetName(h)
-                    if isinstance(name, bytes):
-                        name = name.decode()
+                    name = self._nvml_names[i]
                     util = nvmlDeviceGetUtilizationRates(h)
-                    mem = nvmlDeviceGetMemoryInfo(h)
+                    # Idle GPUs rarely change allocation: re-query memory every 5th sample
+                    mem = self._nvml_mem[i]
+                    if mem is None or util.gpu or self._nvml_mem_age[i] >= 5:
+                        mem = self._nvml_mem[i] = nvmlDeviceGetMemoryInfo(h)
+                        self._nvml_mem_age[i] = 0
+                    self._nvml_mem_age[i] += 1
                     mem_pct = mem.used / mem.total * 100 if mem.total else 0
-                    self.gpu_util_hist[i].append(util.gpu)
-                    self.gpu_mem_hist[i].append(mem_pct)
 
                     # Power & Temp
                     try:
                         temp = nvmlDeviceGetTemperature(h, NVML_TEMPERATURE_GPU)
-                        try:
-                            temp_limit = nvmlDeviceGetTemperatureThreshold(h, NVML_TEMPERATURE_THRESHOLD_SLOWDOWN)
-                        except Exception:
+                        temp_limit = self._nvml_slowdown[i]
+                        if temp_limit is None:
                             temp_limit = 90
                         temp_pct = max(0, (temp - 30) / (temp_limit - 30) * 100) if temp_limit > 30 else 0
                     except Exception:
@@ -714,9 +1025,6 @@ class KTop:
                     except Exception:
                         power_w = power_limit_w = power_pct = 0
 
-                    self.gpu_power_hist[i].append(power_pct)
-                    self.gpu_temp_hist[i].append(temp_pct)
-
                     # PCIe info
                     try:
                         pcie_gen = nvmlDeviceGetCurrPcieLinkGeneration(h)
@@ -730,9 +1038,6 @@ class KTop:
                     except Exception:
                         pcie_gen = pcie_width = pcie_tx = pcie_rx = tx_pct = rx_pct = 0
 
-                    self.gpu_pcie_tx_hist[i].append(tx_pct)
-                    self.gpu_pcie_rx_hist[i].append(rx_pct)
-
                     gpus.append(
                         {
                             "id": i,
@@ -761,6 +1066,16 @@ class KTop:
         gpus.extend(self._amd_gpu_info())
         return gpus
 
+    def _push_gpu_history(self, gpus: list[dict]) -> None:
+        for g in gpus:
+            i = g["id"]
+            self.gpu_util_hist[i].append(g["util"])
+            self.gpu_mem_hist[i].append(g["mem_pct"])
+            self.gpu_power_hist[i].append(g["power_pct"])
+            self.gpu_temp_hist[i].append(g["temp_pct"])
+            self.gpu_pcie_tx_hist[i].append(g["pcie_tx_pct"])
+            self.gpu_pcie_rx_hist[i].append(g["pcie_rx_pct"])
+
     def _amd_gpu_info(self) -> list[dict]:
         """Read per-frame AMD GPU metrics from cached sysfs paths."""
         gpus = []
@@ -769,64 +1084,48 @@ class KTop:
             try:
                 # Utilization
                 util = 0
-                if card["has_util"]:
+                if card["util_fd"] is not None:
                     try:
-                        with open(card["util_path"]) as f:
-                            util = int(f.read().strip())
+                        util = _pread_int(card["util_fd"])
                     except (OSError, ValueError):
                         pass
 
                 # VRAM
                 mem_used = 0
                 mem_total = card["vram_total_bytes"]
-                if card["has_vram"]:
+                if card["vram_used_fd"] is not None:
                     try:
-                        with open(card["vram_used_path"]) as f:
-                            mem_used = int(f.read().strip())
+                        mem_used = _pread_int(card["vram_used_fd"])
                     except (OSError, ValueError):
                         pass
 
                 mem_pct = mem_used / mem_total * 100 if mem_total else 0
-                self.gpu_util_hist[idx].append(util)
-                self.gpu_mem_hist[idx].append(mem_pct)
 
                 # Temp
                 temp = 0
                 temp_limit = 95
                 temp_pct = 0
-                if card["temp_path"]:
+                if card["temp_fd"] is not None:
                     try:
-                        with open(card["temp_path"]) as f:
-                            temp = int(f.read().strip()) / 1000
-                        if card["temp_crit_path"]:
-                            try:
-                                with open(card["temp_crit_path"]) as f:
-                                    temp_limit = int(f.read().strip()) / 1000
-                            except (OSError, ValueError): pass
+                        temp = _pread_int(card["temp_fd"]) / 1000
+                        if card["temp_crit"] is not None:
+                            temp_limit = card["temp_crit"]
                         temp_pct = max(0, (temp - 30) / (temp_limit - 30) * 100) if temp_limit > 30 else 0
                     except (OSError, ValueError): pass
-                self.gpu_temp_hist[idx].append(temp_pct)
 
                 # Power
                 power_w = 0
                 power_limit_w = 250
                 power_pct = 0
-                if card["power_path"]:
+                if card["power_fd"] is not None:
                     try:
-                        with open(card["power_path"]) as f:
-                            power_w = int(f.read().strip()) / 1_000_000 # microwatts → watts
-                        if card["power_cap_path"]:
+                        power_w = _pread_int(card["power_fd"]) / 1_000_000 # microwatts → watts
+                        if card["power_cap_fd"] is not None:
                             try:
-                                with open(card["power_cap_path"]) as f:
-                                    power_limit_w = int(f.read().strip()) / 1_000_000
+                                power_limit_w = _pread_int(card["power_cap_fd"]) / 1_000_000
                             except (OSError, ValueError): pass
                         power_pct = (power_w / power_limit_w) * 100 if power_limit_w else 0
                     except (OSError, ValueError): pass
-                self.gpu_power_hist[idx].append(power_pct)
-
-                # AMD PCIe history placeholder
-                self.gpu_pcie_tx_hist[idx].append(0)
-                self.gpu_pcie_rx_hist[idx].append(0)
 
                 gpus.append({
                     "id": idx,
@@ -852,8 +1151,11 @@ class KTop:
                 pass
         return gpus
 
-    def _scan_procs(self) -> None:
-        """Scan process list from /proc directly, cached for 5 seconds."""
+    def _scan_procs(self, total_mem: int) -> None:
+        """Scan process list from /proc directly, cached for 5 seconds.
+
+        total_mem comes from the caller's virtual_memory() reading for this tick.
+        """
         now = time.monotonic()
         elapsed = now - self._last_proc_scan
         # First scan needs 1s for stable CPU deltas, subsequent scans every 3s
@@ -862,11 +1164,10 @@ class KTop:
             return
         dt = now - self._last_proc_scan if self._last_proc_scan > 0 else 1.0
         self._last_proc_scan = now
-        total_mem = psutil.virtual_memory().total
         ps = self._page_size
         cpu_prev = self._proc_cpu_prev
         ct = self._clock_ticks
-        nc = self._num_cpus
+        cache = self._proc_cache
         procs = []
         for pid_str in os.listdir("/proc"):
             if not pid_str.isdigit():
@@ -876,44 +1177,72 @@ class KTop:
                 continue
             try:
                 fd = os.open(f"/proc/{pid}/stat", os.O_RDONLY)
-                stat = os.read(fd, 512)
-                os.close(fd)
+                try:
+                    stat = os.read(fd, 512)
+                finally:
+                    os.close(fd)
                 i1 = stat.rindex(b")")
                 fields = stat[i1 + 2:].split(None, 22)
                 utime = int(fields[11])   # field 14
                 stime = int(fields[12])   # field 15
                 rss = int(fields[21]) * ps  # field 24
-                name = stat[stat.index(b"(") + 1:i1].decode("utf-8", errors="replace")
+                start = fields[19]        # field 22, raw bytes
+                # (pid, starttime) identifies a process; a mismatch means the pid was recycled
+                p = cache.get(pid)
+                if p is None or p["start_time"] != start:
+                    if p is not None:
+                        cpu_prev.pop(pid, None)
+                    p = cache[pid] = {"pid": pid, "start_time": start, "comm": None}
+                # comm sits right after "<pid> (" and only changes on exec/prctl;
+                # decode it only when the raw bytes differ from last scan
+                comm = stat[len(pid_str) + 2:i1]
+                if comm != p["comm"]:
+                    p["comm"] = comm
+                    p["name"] = comm.decode("utf-8", errors="replace")[:28]
                 mem_pct = rss / total_mem * 100 if total_mem else 0
                 cpu_total = utime + stime
                 prev = cpu_prev.get(pid, cpu_total)
                 cpu_delta = cpu_total - prev
                 cpu_prev[pid] = cpu_total
                 cpu_pct = (cpu_delta / ct) / dt * 100 if dt > 0 else 0
-                procs.append({
-                    "pid": pid, "name": name[:28],
-                    "cpu_percent": cpu_pct, "memory_percent": mem_pct,
-                    "rss": rss,
-                })
+                # Always numbers, so the top-N keys and table can index directly
+                p["cpu_percent"] = cpu_pct
+                p["memory_percent"] = mem_pct
+                p["rss"] = rss
+                procs.append(p)
             except (FileNotFoundError, PermissionError, IndexError, ValueError, ProcessLookupError, OSError):
                 continue
         # Clean stale PIDs
         current = {p["pid"] for p in procs}
         self._proc_cpu_prev = {k: v for k, v in cpu_prev.items() if k in current}
-        self._procs_by_mem = sorted(procs, key=lambda x: x.get("memory_percent", 0) or 0, reverse=True)[:10]
-        self._procs_by_cpu = sorted(procs, key=lambda x: x.get("cpu_percent", 0) or 0, reverse=True)[:10]
-        # Deferred: only read statm for the top procs we actually display
-        displayed = {p["pid"] for p in self._procs_by_mem} | {p["pid"] for p in self._procs_by_cpu}
-        for p in procs:
-            if p["pid"] not in displayed:
+        if len(cache) > len(current):
+            self._proc_cache = {k: v for k, v in cache.items() if k in current}
+        # Top 10 without sorting the whole list: O(P log 10) instead of O(P log P)
+        self._procs_by_mem = heapq.nlargest(10, procs, key=_BY_MEM_PCT)
+        self._procs_by_cpu = heapq.nlargest(10, procs, key=_BY_CPU_PCT)
+        # Deferred: only read statm for the top procs we actually display, and
+        # only every STATM_EVERY scans per process (shared pages move slowly)
+        gen = self._proc_gen
+        for p in self._procs_by_mem + self._procs_by_cpu:
+            if p.get("shared_gen") == gen:
+                continue  # in both top lists
+            if "shared_gen" in p and gen - p["shared_gen"] < STATM_EVERY:
+                p["memory_info"] = SimpleNamespace(rss=p["rss"], shared=p["shared"])
                 continue
             try:
                 fd = os.open(f"/proc/{p['pid']}/statm", os.O_RDONLY)
-                shared = int(os.read(fd, 128).split()[2]) * ps
-                os.close(fd)
-            except (FileNotFoundError, PermissionError, IndexError, ValueError, OSError):
+                try:
+                    statm = os.read(fd, 128)
+                finally:
+                    os.close(fd)
+                # "size resident shared ...": stop splitting after the field we need
+                shared = int(statm.split(None, 3)[2]) * ps
+            except (OSError, IndexError, ValueError):
                 shared = 0
+            p["shared"] = shared
+            p["shared_gen"] = gen
             p["memory_info"] = SimpleNamespace(rss=p["rss"], shared=shared)
+        self._proc_gen += 1
 
     def _top_procs(self, key: str) -> list[dict]:
         if key == "memory_percent":
@@ -923,14 +1252,19 @@ class KTop:
     _SIM_PROCS = ["python3", "node", "java", "ollama", "vllm", "ffmpeg", "cc1plus", "rustc", "chrome", "mysqld"]
 
     _UUID_RE = re.compile(r"-[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+    # journalctl -o short-unix lines: "<epoch.usec> <host> kernel: ..."
+    _OOM_TS_RE = re.compile(r"^(\d+\.\d+)\s")
+    _OOM_KPROC_RE = re.compile(r"Killed process \d+ \(([^)]+)\)")
+    # "Killed /long/cgroup/path/unit.scope due to memory pressure..."
+    _OOM_SCOPE_RE = re.compile(r"Killed\s+\S*/([^/\s]+)\s+due to")
 
     def _check_oom(self) -> str | None:
-        """Return most recent OOM kill in last 8h via journalctl, cached for 5s.
+        """Return most recent OOM kill in last 8h via journalctl, cached for OOM_CHECK_INTERVAL.
 
         Checks both kernel OOM kills and systemd-oomd kills.
         """
         now = time.monotonic()
-        if now - self._last_oom_check < 5.0:
+        if now - self._last_oom_check < OOM_CHECK_INTERVAL:
             return self._last_oom_str
         self._last_oom_check = now
         if self.sim:
@@ -942,75 +1276,290 @@ class KTop:
                 self._last_oom_str = f"{fake_time.strftime('%b %d %H:%M:%S')} {proc}"
             return self._last_oom_str
 
-        candidates = []  # list of (epoch_float, display_name)
+        candidates = None
+        if _SYSTEMD_JOURNAL and self._journal is not False:
+            try:
+                candidates = self._oom_from_journal()
+            except Exception:
+                self._journal = False  # use journalctl from now on
+        if candidates is None:
+            candidates = self._oom_from_journalctl()
 
-        # 1) Kernel OOM kills
-        try:
-            r = subprocess.run(
-                ["journalctl", "-k", "--since", "8 hours ago",
-                 "--no-pager", "-o", "short-unix", "--grep", "Killed process"],
-                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
-                text=True, timeout=3,
-            )
-            if r.returncode == 0 and r.stdout.strip():
-                line = r.stdout.strip().splitlines()[-1]
-                ts_m = re.match(r"^(\d+\.\d+)\s", line)
-                proc_m = re.search(r"Killed process \d+ \(([^)]+)\)", line)
-                if ts_m and proc_m:
-                    candidates.append((float(ts_m.group(1)), proc_m.group(1)))
-        except Exception:
-            pass
+        if candidates:
+            candidates.sort(key=lambda x: x[0], reverse=True)
+            epoch, proc = candidates[0]
+            dt = datetime.fromtimestamp(epoch)
+            self._last_oom_str = f"{dt.strftime('%b %d %H:%M:%S')} {proc}"
+        else:
+            self._last_oom_str = None
+        return self._last_oom_str
 
-        # 2) systemd-oomd kills
+    def _oom_name_from_scope(self, line: str) -> str:
+        """Unit name from a systemd-oomd "Killed <cgroup path> due to" message."""
+        scope_m = self._OOM_SCOPE_RE.search(line)
+        name = scope_m.group(1) if scope_m else "oomd-kill"
+        # Clean up scope name: strip .scope suffix and UUIDs
+        name = name.replace(".scope", "").replace(".service", "")
+        return self._UUID_RE.sub("", name)
+
+    def _oom_from_journal(self) -> list[tuple[float, str]]:
+        """Newest kernel/oomd OOM kill within 8h, read in-process with systemd.journal.
+
+        Same matches as the journalctl query (kernel messages from this boot,
+        systemd-oomd unit). The first check walks back from the tail to the
+        newest kill or the 8h cutoff; later checks resume after the newest
+        entry already examined and read only what was appended since.
+        """
+        if self._journal is None:
+            with open("/proc/sys/kernel/random/boot_id") as f:
+                boot_id = f.read().strip().replace("-", "")
+            r = _journal.Reader()
+            # journalctl -k only covers the current boot
+            r.add_match(_TRANSPORT="kernel", _BOOT_ID=boot_id)
+            r.add_disjunction()
+            r.add_match(_SYSTEMD_UNIT="systemd-oomd.service")
+            r.wait(0)  # sets up inotify on the journal directories
+            self._journal = r
+        r = self._journal
+        # sd-journal only picks up rotated/new journal files while processing
+        # inotify events; INVALIDATE needs no extra handling, since both paths
+        # below re-seek (from the tail or the saved cursor) anyway
+        r.wait(0)
+        since = time.time() - 8 * 3600
+        if self._journal_cursor is None:
+            r.seek_tail()
+            while True:
+                entry = r.get_previous()
+                if not entry:
+                    break
+                if self._journal_cursor is None:
+                    self._journal_cursor = entry["__CURSOR"]
+                epoch, name = self._oom_from_entry(entry)
+                if epoch < since:
+                    break
+                if name is not None:
+                    self._journal_kill = (epoch, name)
+                    break
+        else:
+            r.seek_cursor(self._journal_cursor)
+            while True:
+                entry = r.get_next()
+                if not entry:
+                    break
+                cursor = entry["__CURSOR"]
+                if cursor == self._journal_cursor:
+                    continue  # seek_cursor lands on the entry itself
+                self._journal_cursor = cursor
+                epoch, name = self._oom_from_entry(entry)
+                if name is not None and epoch >= since:
+                    self._journal_kill = (epoch, name)
+        if self._journal_kill is not None and self._journal_kill[0] < since:
+            self._journal_kill = None
+        return [self._journal_kill] if self._journal_kill else []
+
+    def _oom_from_entry(self, entry: dict) -> tuple[float, str | None]:
+        """(epoch, process or unit name) for a journal entry; name is None unless it is a kill."""
+        ts = entry.get("_SOURCE_REALTIME_TIMESTAMP") or entry["__REALTIME_TIMESTAMP"]
+        epoch = ts.timestamp()
+        msg = entry.get("MESSAGE")
+        if not isinstance(msg, str):
+            return epoch, None
+        if entry.get("_TRANSPORT") == "kernel":
+            proc_m = self._OOM_KPROC_RE.search(msg)
+            return epoch, proc_m.group(1) if proc_m else None
+        if "Killed" in msg:
+            return epoch, self._oom_name_from_scope(msg)
+        return epoch, None
+
+    def _oom_from_journalctl(self) -> list[tuple[float, str]]:
+        """Newest kernel and systemd-oomd OOM kills within 8h, from one journalctl run."""
+        candidates = []  # list of (epoch_float, display_name)
         try:
             r = subprocess.run(
-                ["journalctl", "-u", "systemd-oomd", "--since", "8 hours ago",
-                 "--no-pager", "-o", "short-unix", "--grep", "Killed"],
+                ["journalctl", "_TRANSPORT=kernel", "+", "_SYSTEMD_UNIT=systemd-oomd.service",
+                 "--since", "8 hours ago", "--no-pager", "-o", "short-unix", "--grep", "Killed"],
                 stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
                 text=True, timeout=3,
             )
-            if r.returncode == 0 and r.stdout.strip():
-                line = r.stdout.strip().splitlines()[-1]
-                ts_m = re.match(r"^(\d+\.\d+)\s", line)
-                # "Killed /long/cgroup/path/unit.scope due to memory pressure..."
-                scope_m = re.search(r"Killed\s+\S*/([^/\s]+)\s+due to", line)
-                if ts_m:
-                    name = scope_m.group(1) if scope_m else "oomd-kill"
-                    # Clean up scope name: strip .scope suffix and UUIDs
-                    name = name.replace(".scope", "").replace(".service", "")
-                    name = self._UUID_RE.sub("", name)
-                    candidates.append((float(ts_m.group(1)), name))
+            if r.returncode != 0:
+                return candidates
+            # journalctl -k used to limit kernel messages to the current boot
+            boot = psutil.boot_time()
+            kernel = oomd = False
+            for line in reversed(r.stdout.splitlines()):
+                ts_m = self._OOM_TS_RE.match(line)
+                if not ts_m:
+                    continue
+                epoch = float(ts_m.group(1))
+                if " kernel: " in line:
+                    proc_m = self._OOM_KPROC_RE.search(line)
+                    if not kernel and proc_m and epoch >= boot:
+                        candidates.append((epoch, proc_m.group(1)))
+                        kernel = True
+                elif not oomd:
+                    candidates.append((epoch, self._oom_name_from_scope(line)))
+                    oomd = True
+                if kernel and oomd:
+                    break
         except Exception:
             pass
+        return candidates
 
-        if candidates:
-            candidates.sort(key=lambda x: x[0], reverse=True)
-            epoch, proc = candidates[0]
-            dt = datetime.fromtimestamp(epoch)
-            self._last_oom_str = f"{dt.strftime('%b %d %H:%M:%S')} {proc}"
+    # ── sampler thread ───────────────────────────────────────────────────
+    def _sample(self) -> None:
+        """Collect one snapshot of every metric. Runs on the sampler thread.
+
+        Slow I/O (NVML, sensors) happens outside the lock; only history
+        appends, the process scan and the snapshot swap hold it. Once run()
+        has started the OOM thread, its latest result is picked up as is.
+        """
+        if self._oom_thread is not None:
+            oom = self._last_oom_str
         else:
-            self._last_oom_str = None
-        return self._last_oom_str
+            oom = self._check_oom()
+        now = time.monotonic()
+        if self._snapshot is None or self._tick % self._temp_every == 0:
+            if now - self._last_sensor_scan >= SENSOR_RESCAN_INTERVAL:
+                self._rediscover_sensors()
+                self._last_sensor_scan = now
+            temps = self._sample_temps()
+        else:
+            temps = self._snapshot.temps
+        # With sub-second refresh, GPUs keep their own slower cadence; the last
+        # reading is repeated so GPU sparklines scroll in step with the others
+        if (self._snapshot is None or self.refresh >= GPU_SAMPLE_INTERVAL
+                or now - self._last_gpu_sample >= GPU_SAMPLE_INTERVAL):
+            gpus = self._gpu_info()
+            self._last_gpu_sample = now
+        else:
+            gpus = self._snapshot.gpus
+        # swap_memory() also parses /proc/vmstat; neither has a history to feed
+        if self._snapshot is None or self._tick % self._mem_every == 0:
+            vm = psutil.virtual_memory()
+            sw = psutil.swap_memory()
+        else:
+            vm, sw = self._snapshot.vm, self._snapshot.sw
+        self._tick += 1
+        self._sample_cpu_freq()
+        cpu = self._sample_cpu()
+        up, down = self._sample_net()
+        with self._lock:
+            self.cpu_hist.append(cpu)
+            self.net_up_hist.append(up)
+            self.net_down_hist.append(down)
+            self._push_gpu_history(gpus)
+            self._scan_procs(vm.total)
+            self._snapshot = SimpleNamespace(
+                cpu=cpu, up=up, down=down, gpus=gpus, vm=vm, sw=sw, temps=temps, oom=oom,
+            )
+        self._wake_ui()
+
+    def _wake_ui(self) -> None:
+        """Tell the UI loop there is something new to draw."""
+        self._data_ready.set()
+        if self._wake_w is not None:
+            try:
+                os.write(self._wake_w, b"\0")
+            except BlockingIOError:
+                pass  # pipe full: the UI has wakeups pending already
+
+    def _sampler_failed(self, exc: Exception) -> None:
+        """Surface a failed sample in the status bar (and the profile log in --sim mode)."""
+        self._sampler_error = f"{type(exc).__name__}: {exc}"[:60]
+        if self._prof_log:
+            import traceback
+            with open(self._prof_log, "a") as f:
+                f.write(f"\n── sampler error @ {datetime.now().strftime('%H:%M:%S')} ──\n")
+                traceback.print_exc(file=f)
+        self._wake_ui()
+
+    def _sampler_loop(self) -> None:
+        deadline = time.monotonic() + self.refresh
+        while not self._stop.wait(max(0.0, deadline - time.monotonic())):
+            # Cleared first so the frame published by a good sample drops the note
+            self._sampler_error = None
+            try:
+                self._sample()
+            except Exception as e:
+                # Keep sampling, but don't leave the UI silently frozen
+                self._sampler_failed(e)
+            now = time.monotonic()
+            deadline += self.refresh
+            if deadline <= now:
+                # Fell a whole period behind (e.g. suspended): resync
+                deadline = now + self.refresh
+
+    def _oom_loop(self) -> None:
+        while not self._stop.wait(OOM_CHECK_INTERVAL):
+            try:
+                self._check_oom()
+            except Exception:
+                pass
 
     # ── panel builders ───────────────────────────────────────────────────
+    def _set_theme(self, name: str) -> None:
+        self.theme_name = name
+        self.theme = THEMES[name]
+        self._titles: dict[str, Text] = {}
+
+    def _title(self, key: str, label: str, colour: str) -> Text:
+        """Panel title as prebuilt Text (Rich would re-parse a markup string every render).
+
+        Cached per panel until the theme changes.
+        """
+        title = self._titles.get(key)
+        if title is None:
+            title = self._titles[key] = Text.from_markup(f"[bold {colour}] {label} [/bold {colour}]")
+        return title
+
+    def _reuse_panel(
+        self, key: str, renderable, title: str | Text, border_style: str, subtitle: str | Text | None = None,
+        content=None,
+    ) -> Panel:
+        """Return the cached Panel for `key` with new contents swapped in.
+
+        `content` (default: the renderable) is compared with last frame's to
+        tell whether the panel changed on screen; Text compares by text and spans.
+        """
+        sig = (renderable if content is None else content, title, subtitle, border_style)
+        if self._panel_sigs.get(key) != sig:
+            self._panel_sigs[key] = sig
+            self._frame_changed = True
+        panel = self._panels.get(key)
+        if panel is None:
+            panel = self._panels[key] = Panel(renderable, title=title, subtitle=subtitle, border_style=border_style)
+        else:
+            panel.renderable = renderable
+            panel.title = title
+            panel.subtitle = subtitle
+            panel.border_style = border_style
+        return panel
+
     def _gpu_panels(self) -> Layout:
         t = self.theme
-        gpus = self._gpu_info()
+        gpus = self._snapshot.gpus
         if not gpus:
-            return Panel(
+            return self._reuse_panel(
+                "gpu",
                 Text("No GPUs detected (install pynvml for NVIDIA, or load amdgpu driver for AMD)", style="dim italic"),
-                title=f"[bold {t['gpu']}] GPU [/bold {t['gpu']}]",
+                title=self._title("gpu", "GPU", t["gpu"]),
                 border_style=t["gpu"],
             )
 
-        gpu_layout = Layout()
+        # Rebuild the row of GPU cells only if the set of reporting GPUs changed
+        ids = tuple(g["id"] for g in gpus)
+        if self._gpu_layout is None or ids != self._gpu_layout_ids:
+            self._gpu_cells = [Layout(name=f"gpu{i}", ratio=1) for i in ids]
+            self._gpu_layout = Layout()
+            self._gpu_layout.split_row(*self._gpu_cells)
+            self._gpu_layout_ids = ids
+            self._frame_changed = True
         # Panel inner width: total / num_gpus, minus border(2) + padding(2) + safety(2)
-        panel_w = max(20, self.console.width // max(len(gpus), 1) - 6)
+        panel_w = max(20, self._term_width // max(len(gpus), 1) - 6)
         # label(5) + space(1) + value(5/6) + unit(1/2) = 12
         bar_w = max(5, panel_w - 12)
         spark_w = max(10, panel_w - 5)
-        children = []
-        for g in gpus:
+        for cell, g in zip(self._gpu_cells, gpus):
             uc = _color_for(g["util"], t)
             mc = _color_for(g["mem_pct"], t)
             pc = _color_for(g["power_pct"], t)
@@ -1019,16 +1568,33 @@ class KTop:
             spark_m = _sparkline(self.gpu_mem_hist[g["id"]], width=spark_w)
             spark_p = _sparkline(self.gpu_power_hist[g["id"]], width=spark_w)
             spark_t = _sparkline(self.gpu_temp_hist[g["id"]], width=spark_w)
-
-            body = (
-                f"[bold]Util[/bold] {_bar(g['util'], bar_w, t)} [{uc}]{g['util']:4.0f}%[/{uc}]\n"
-                f"     [{uc}]{spark_u}[/{uc}]\n"
-                f"[bold]Mem [/bold] {_bar(g['mem_pct'], bar_w, t)} [{mc}]{g['mem_pct']:4.0f}%[/{mc}]\n"
-                f"     {g['mem_used_gb']:.1f}/{g['mem_total_gb']:.1f} GB\n"
-                f"     [{mc}]{spark_m}[/{mc}]\n"
-                f"[bold]Pwr [/bold] {_bar(g['power_pct'], bar_w, t)} [{pc}]{g['power_w']:4.0f}W[/{pc}]\n"
-                f"     [{pc}]{spark_p}[/{pc}]\n"
-            )
+            us, ms, ps = _style(uc), _style(mc), _style(pc)
+
+            body = Text()
+            body.append("Util", _STYLE_BOLD)
+            body.append(" ")
+            body.append_text(_bar(g["util"], bar_w, t))
+            body.append(" ")
+            body.append(f"{g['util']:4.0f}%", us)
+            body.append("\n     ")
+            body.append(spark_u, us)
+            body.append("\n")
+            body.append("Mem ", _STYLE_BOLD)
+            body.append(" ")
+            body.append_text(_bar(g["mem_pct"], bar_w, t))
+            body.append(" ")
+            body.append(f"{g['mem_pct']:4.0f}%", ms)
+            body.append(f"\n     {g['mem_used_gb']:.1f}/{g['mem_total_gb']:.1f} GB\n     ")
+            body.append(spark_m, ms)
+            body.append("\n")
+            body.append("Pwr ", _STYLE_BOLD)
+            body.append(" ")
+            body.append_text(_bar(g["power_pct"], bar_w, t))
+            body.append(" ")
+            body.append(f"{g['power_w']:4.0f}W", ps)
+            body.append("\n     ")
+            body.append(spark_p, ps)
+            body.append("\n")
 
             if g.get("pcie_gen"):
                 tx_pct = g["pcie_tx_pct"]
@@ -1045,124 +1611,118 @@ class KTop:
                 simplex_w = spark_w
                 simplex = _simplex_bar(rx_pct, tx_pct, simplex_w, t)
 
-                body += (
-                    f"[dim]PCIe{g['pcie_gen']}x{g['pcie_width']}[/dim] R/T {rx_val} / {tx_val} {unit}\n"
-                    f"[bold]Bus  [/bold]{simplex}\n"
-                    f"     [{c_rx}]{spark_rx}[/{c_rx}]\n"
-                    f"     [{c_tx}]{spark_tx_down}[/{c_tx}]"
-                )
-            name_short = g["name"].replace("NVIDIA ", "").replace("AMD ", "").replace("Advanced Micro Devices, Inc. ", "").replace(" Generation", "")
-            panel = Panel(
-                Text.from_markup(body),
-                title=f"[bold {t['gpu']}] GPU {g['id']} [/bold {t['gpu']}]",
-                subtitle=f"[dim]{name_short}[/dim]",
+                body.append(f"PCIe{g['pcie_gen']}x{g['pcie_width']}", _STYLE_DIM)
+                body.append(f" R/T {rx_val} / {tx_val} {unit}\n")
+                body.append("Bus  ", _STYLE_BOLD)
+                body.append_text(simplex)
+                body.append("\n     ")
+                body.append(spark_rx, _style(c_rx))
+                body.append("\n     ")
+                body.append(spark_tx_down, _style(c_tx))
+            subtitle = self._titles.get(f"gpu{g['id']}_name")
+            if subtitle is None:
+                name_short = g["name"].replace("NVIDIA ", "").replace("AMD ", "").replace("Advanced Micro Devices, Inc. ", "").replace(" Generation", "")
+                subtitle = self._titles[f"gpu{g['id']}_name"] = Text.from_markup(f"[dim]{name_short}[/dim]")
+            cell.update(self._reuse_panel(
+                f"gpu{g['id']}",
+                body,
+                title=self._title(f"gpu{g['id']}", f"GPU {g['id']}", t["gpu"]),
+                subtitle=subtitle,
                 border_style=t["gpu"],
-            )
-            child = Layout(name=f"gpu{g['id']}", ratio=1)
-            child.update(panel)
-            children.append(child)
+            ))
 
-        gpu_layout.split_row(*children)
-        return gpu_layout
+        return self._gpu_layout
 
     def _cpu_panel(self) -> Panel:
         t = self.theme
-        pct = self._sample_cpu()
+        pct = self._snapshot.cpu
         c = _color_for(pct, t)
-        # Refresh frequency every 5s via sysfs (0.02ms vs 9ms for psutil.cpu_freq)
-        now = time.monotonic()
-        if now - self._last_freq_check >= 5.0:
-            self._last_freq_check = now
-            try:
-                with open("/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq", "rb") as f:
-                    self._cpu_freq_str = f"{int(f.read()) / 1000:.0f} MHz"
-            except (FileNotFoundError, ValueError, OSError):
-                # Fallback to psutil on systems without sysfs cpufreq
-                try:
-                    freq = psutil.cpu_freq()
-                    if freq:
-                        self._cpu_freq_str = f"{freq.current:.0f} MHz"
-                except Exception:
-                    pass
 
         # Panel inner width: third of terminal minus border(2) + padding(2) + safety(2)
-        panel_w = max(20, self.console.width // 3 - 6)
+        panel_w = max(20, self._term_width // 3 - 6)
         # "Overall  " = 9 chars, " XX.X%" = 7 chars (space + 5-wide float + %)
         bar_w = max(5, panel_w - 9 - 7)
         spark_w = max(10, panel_w - 9)
         spark_top, spark_bot = _sparkline_double(self.cpu_hist, width=spark_w)
-        body = (
-            f"[bold]Overall[/bold]  {_bar(pct, bar_w, t)} [{c}]{pct:5.1f}%[/{c}]\n"
-            f"[dim]Cores: {self._cpu_cores}  Freq: {self._cpu_freq_str}[/dim]\n\n"
-            f"[bold]History[/bold]\n         [{c}]{spark_top}[/{c}]\n         [{c}]{spark_bot}[/{c}]"
-        )
-        return Panel(
-            Text.from_markup(body),
-            title=f"[bold {t['cpu']}] CPU [/bold {t['cpu']}]",
+        cs = _style(c)
+        body = Text()
+        body.append("Overall", _STYLE_BOLD)
+        body.append("  ")
+        body.append_text(_bar(pct, bar_w, t))
+        body.append(" ")
+        body.append(f"{pct:5.1f}%", cs)
+        body.append("\n")
+        body.append(f"Cores: {self._cpu_cores}  Freq: {self._cpu_freq_str}", _STYLE_DIM)
+        body.append("\n\n")
+        body.append("History", _STYLE_BOLD)
+        body.append("\n         ")
+        body.append(spark_top, cs)
+        body.append("\n         ")
+        body.append(spark_bot, cs)
+        return self._reuse_panel(
+            "cpu",
+            body,
+            title=self._title("cpu", "CPU", t["cpu"]),
             border_style=t["cpu"],
         )
 
     def _net_panel(self) -> Panel:
         t = self.theme
-        up, down = self._sample_net()
+        snap = self._snapshot
+        up, down = snap.up, snap.down
         mx = self.net_max_speed
         up_pct = min(100.0, up / mx * 100) if mx else 0
         down_pct = min(100.0, down / mx * 100) if mx else 0
 
         # Panel inner width: third of terminal minus border(2) + padding(2) + safety(2)
-        panel_w = max(20, self.console.width // 3 - 6)
+        panel_w = max(20, self._term_width // 3 - 6)
         # "Up   " / "Down " = 5 chars, " XXXXXXX" speed = 11 chars
         bar_w = max(5, panel_w - 5 - 11)
         spark_w = max(10, panel_w - 5)
-        spark_up = _sparkline(
-            [min(100.0, v / mx * 100) if mx else 0 for v in self.net_up_hist],
-            width=spark_w,
-        )
-        spark_dn = _sparkline_down(
-            [min(100.0, v / mx * 100) if mx else 0 for v in self.net_down_hist],
-            width=spark_w,
-        )
+        # Scale only the visible tail; the sparklines clamp at 100 themselves and
+        # mx is never below 1.0
+        spark_up = _sparkline([v / mx * 100 for v in _spark_tail(self.net_up_hist, spark_w)])
+        spark_dn = _sparkline_down([v / mx * 100 for v in _spark_tail(self.net_down_hist, spark_w)])
 
         nc = t["net"]
-        uc = t["net_up"]
-        dc = t["net_down"]
-        body = (
-            f"[bold]Up  [/bold] {_bar(up_pct, bar_w, t)} [{uc}]{_fmt_speed(up):>10}[/{uc}]\n"
-            f"\n"
-            f"     [{uc}]{spark_up}[/{uc}]\n"
-            f"     [{dc}]{spark_dn}[/{dc}]\n"
-            f"\n"
-            f"[bold]Down[/bold] {_bar(down_pct, bar_w, t)} [{dc}]{_fmt_speed(down):>10}[/{dc}]\n"
-            f"\n"
-            f"[dim]Peak: {_fmt_speed(mx)}[/dim]"
+        us = _style(t["net_up"])
+        ds = _style(t["net_down"])
+        body = Text.assemble(
+            ("Up  ", _STYLE_BOLD), " ", _bar(up_pct, bar_w, t), " ", (f"{_fmt_speed(up):>10}", us),
+            "\n\n     ", (spark_up, us),
+            "\n     ", (spark_dn, ds),
+            "\n\n", ("Down", _STYLE_BOLD), " ", _bar(down_pct, bar_w, t), " ", (f"{_fmt_speed(down):>10}", ds),
+            "\n\n", (f"Peak: {_fmt_speed(mx)}", _STYLE_DIM),
         )
-        return Panel(
-            Text.from_markup(body),
-            title=f"[bold {nc}] Network [/bold {nc}]",
+        return self._reuse_panel(
+            "net",
+            body,
+            title=self._title("net", "Network", nc),
             border_style=nc,
         )
 
     def _mem_panel(self) -> Panel:
         t = self.theme
-        vm = psutil.virtual_memory()
-        sw = psutil.swap_memory()
+        vm = self._snapshot.vm
+        sw = self._snapshot.sw
 
         used_pct = vm.percent
         c = _color_for(used_pct, t)
 
         # Panel inner width: third of terminal minus border(2) + padding(2) + safety(2)
-        panel_w = max(20, self.console.width // 3 - 6)
+        panel_w = max(20, self._term_width // 3 - 6)
         # "RAM  " / "Swap " = 5 chars, " XX.X%" = 7 chars (space + 5-wide float + %)
         bar_w = max(5, panel_w - 5 - 7)
-        body = (
-            f"[bold]RAM[/bold]  {_bar(used_pct, bar_w, t)} [{c}]{used_pct:5.1f}%[/{c}]\n"
-            f"  {_fmt_bytes(vm.used)} used / {_fmt_bytes(vm.total)}\n\n"
-            f"[bold]Swap[/bold] {_bar(sw.percent, bar_w, t)} [dim]{sw.percent:5.1f}%[/dim]\n"
-            f"  {_fmt_bytes(sw.used)} used / {_fmt_bytes(sw.total)}"
+        body = Text.assemble(
+            ("RAM", _STYLE_BOLD), "  ", _bar(used_pct, bar_w, t), " ", (f"{used_pct:5.1f}%", _style(c)),
+            f"\n  {_fmt_bytes(vm.used)} used / {_fmt_bytes(vm.total)}\n\n",
+            ("Swap", _STYLE_BOLD), " ", _bar(sw.percent, bar_w, t), " ", (f"{sw.percent:5.1f}%", _STYLE_DIM),
+            f"\n  {_fmt_bytes(sw.used)} used / {_fmt_bytes(sw.total)}",
         )
-        return Panel(
-            Text.from_markup(body),
-            title=f"[bold {t['mem']}] Memory [/bold {t['mem']}]",
+        return self._reuse_panel(
+            "mem",
+            body,
+            title=self._title("mem", "Memory", t["mem"]),
             border_style=t["mem"],
         )
 
@@ -1187,9 +1747,9 @@ class KTop:
 
         for p in procs:
             pid = str(p.get("pid", ""))
-            name = (p.get("name") or "?")[:28]
-            mem_pct = p.get("memory_percent") or 0
-            cpu_pct = p.get("cpu_percent") or 0
+            name = p.get("name") or "?"  # already capped at 28 by _scan_procs
+            mem_pct = p["memory_percent"]
+            cpu_pct = p["cpu_percent"]
             if is_mem:
                 mi = p.get("memory_info")
                 if mi:
@@ -1204,27 +1764,24 @@ class KTop:
                 sys_pct = cpu_pct / self._num_cpus
                 table.add_row(pid, name, f"{cpu_pct:.1f}%", f"{sys_pct:.1f}%", f"{mem_pct:.1f}%")
 
-        return Panel(table, title=f"[bold {colour}] {title} [/bold {colour}]", border_style=colour)
+        return Panel(table, title=self._title(by, title, colour), border_style=colour)
 
     def _status_bar(self) -> Table:
         t = self.theme
-        left = Text()
-        left.append(" q", style=f"bold {t['cpu']}")
-        left.append("/", style="dim")
-        left.append("ESC", style=f"bold {t['cpu']}")
-        left.append(" Quit  ", style="dim")
-        left.append(" t", style=f"bold {t['gpu']}")
-        left.append(f" Theme ({self.theme_name})  ", style="dim")
-
-        right = Text()
-        oom = self._check_oom()
+        cpu_key = _STYLE_BOLD + _style(t["cpu"])
+        left = Text.assemble(
+            (" q", cpu_key), ("/", _STYLE_DIM), ("ESC", cpu_key), (" Quit  ", _STYLE_DIM),
+            (" t", _STYLE_BOLD + _style(t["gpu"])), (f" Theme ({self.theme_name})  ", _STYLE_DIM),
+        )
+
+        oom = self._snapshot.oom
+        high = _style(t["bar_high"])
         if oom:
-            right.append("█ ", style=t["bar_high"])
-            right.append("OOM Kill: ", style=f"bold {t['bar_high']}")
-            right.append(oom + " ", style=t["bar_high"])
+            right = Text.assemble(("█ ", high), ("OOM Kill: ", _STYLE_BOLD + high), (oom + " ", high))
         else:
-            right.append("░ ", style="dim")
-            right.append("No OOM kills ", style="dim")
+            right = Text.assemble(("░ ", _STYLE_DIM), ("No OOM kills ", _STYLE_DIM))
+        if self._sampler_error:
+            right = Text.assemble(("Sampler error: ", _STYLE_BOLD + high), (self._sampler_error + "  ", high), right)
 
         bar = Table(box=None, pad_edge=False, show_header=False, expand=True)
         bar.add_column(ratio=1)
@@ -1234,14 +1791,14 @@ class KTop:
 
     def _temp_strip(self) -> Panel:
         """Temperature strip with mini bar charts, evenly spaced."""
-        temps = self._sample_temps()
+        temps = self._snapshot.temps
         t = self.theme
 
         def _temp_cell(label: str, temp_c: float | None, max_c: float = 100.0) -> Text:
             cell = Text()
-            cell.append(f"{label} ", style="bold dim")
+            cell.append(f"{label} ", _STYLE_BOLD_DIM)
             if temp_c is None:
-                cell.append("N/A", style="dim")
+                cell.append("N/A", _STYLE_DIM)
                 return cell
             pct = min(100.0, temp_c / max_c * 100)
             ratio = temp_c / max_c
@@ -1252,9 +1809,10 @@ class KTop:
             else:
                 c = t["bar_high"]
             filled = int(pct / 100 * 8)
-            cell.append("█" * filled, style=c)
-            cell.append("░" * (8 - filled), style="dim")
-            cell.append(f" {temp_c:.0f}/{max_c:.0f}°C", style=c)
+            cs = _style(c)
+            cell.append("█" * filled, cs)
+            cell.append("░" * (8 - filled), _STYLE_DIM)
+            cell.append(f" {temp_c:.0f}/{max_c:.0f}°C", cs)
             return cell
 
         # Collect all temp cells
@@ -1277,7 +1835,11 @@ class KTop:
             table.add_row(*cells)
 
         tc = t["bar_mid"]
-        return Panel(table, title=f"[bold {tc}] Temps [/bold {tc}]", border_style=tc, height=3)
+        panel = self._reuse_panel(
+            "temps", table, title=self._title("temps", "Temps", tc), border_style=tc, content=tuple(cells),
+        )
+        panel.height = 3
+        return panel
 
     # ── theme picker ─────────────────────────────────────────────────────
     def _theme_picker(self) -> Layout:
@@ -1294,9 +1856,17 @@ class KTop:
         elif cursor_row >= self.theme_scroll + visible_rows:
             self.theme_scroll = cursor_row - visible_rows + 1
 
+        # Sampler wakeups rebuild the frame while the picker is open; reuse it
+        key = (self.theme_scroll, cursor, self.theme_name)
+        if self._picker_cache is not None and self._picker_cache[0] == key:
+            return self._picker_cache[1]
+
+        # One flat grid of (name, swatches) column pairs; the swatch column's
+        # padding gives the same two-space gap a nested per-cell table had
         table = Table(expand=True, box=None, pad_edge=True, show_header=False)
         for _ in range(cols):
             table.add_column(ratio=1)
+            table.add_column(justify="right")
 
         total_rows = (total + cols - 1) // cols
         for row_idx in range(self.theme_scroll, min(self.theme_scroll + visible_rows, total_rows)):
@@ -1330,27 +1900,24 @@ class KTop:
                     swatch.append("  ", style=f"on {th['mem']}")
                     swatch.append(" ")
                     swatch.append("  ", style=f"on {th['bar_mid']}")
-                    # Nested table for left name + right-aligned swatches
-                    cell = Table(box=None, pad_edge=False, show_header=False, expand=True)
-                    cell.add_column(ratio=1)
-                    cell.add_column(justify="right")
-                    cell.add_row(name_text, swatch)
-                    cells.append(cell)
+                    cells.append(name_text)
+                    cells.append(swatch)
                 else:
                     cells.append(Text(""))
+                    cells.append(Text(""))
             table.add_row(*cells)
 
         # Preview the hovered theme
         preview_name = THEME_NAMES[cursor]
         preview = THEMES[preview_name]
-        sample_bar = _bar(65, 20, preview)
-        preview_text = Text.from_markup(
-            f"\n[bold]Preview:[/bold] {preview_name}\n"
-            f"  GPU [{preview['gpu']}]{'━' * 6}[/{preview['gpu']}]  "
-            f"Net [{preview['net']}]{'━' * 6}[/{preview['net']}]  "
-            f"CPU [{preview['cpu']}]{'━' * 6}[/{preview['cpu']}]  "
-            f"Mem [{preview['mem']}]{'━' * 6}[/{preview['mem']}]\n"
-            f"  Bar: {sample_bar}"
+        swatch = "━" * 6
+        preview_text = Text.assemble(
+            "\n", ("Preview:", _STYLE_BOLD), f" {preview_name}\n",
+            "  GPU ", (swatch, _style(preview["gpu"])),
+            "  Net ", (swatch, _style(preview["net"])),
+            "  CPU ", (swatch, _style(preview["cpu"])),
+            "  Mem ", (swatch, _style(preview["mem"])),
+            "\n  Bar: ", _bar(65, 20, preview),
         )
 
         inner = Layout()
@@ -1361,10 +1928,10 @@ class KTop:
         inner["list"].update(table)
         inner["preview"].update(Panel(preview_text, border_style="dim"))
 
-        hint = Text.from_markup(
-            " [bold]UP/DOWN/LEFT/RIGHT[/bold] Navigate  "
-            "[bold]ENTER[/bold] Select  "
-            "[bold]ESC[/bold] Cancel"
+        hint = Text.assemble(
+            " ", ("UP/DOWN/LEFT/RIGHT", _STYLE_BOLD), " Navigate  ",
+            ("ENTER", _STYLE_BOLD), " Select  ",
+            ("ESC", _STYLE_BOLD), " Cancel",
         )
 
         outer = Layout()
@@ -1376,18 +1943,18 @@ class KTop:
             Panel(inner, title="[bold] Select Theme [/bold]", border_style="bright_white")
         )
         outer["hint"].update(hint)
+        self._picker_cache = (key, outer)
         return outer
 
     # ── profiling helpers ────────────────────────────────────────────────
-    def _prof_time(self, label: str, fn):
-        """Time a callable, accumulate result if profiling."""
-        if not self._prof_log:
-            return fn()
-        t0 = time.perf_counter()
-        result = fn()
-        dt = (time.perf_counter() - t0) * 1000  # ms
-        self._prof_accum.setdefault(label, []).append(dt)
-        return result
+    def _timed(self, label: str, fn):
+        """Wrap a callable so each call is accumulated under `label`."""
+        def timed(*args, **kwargs):
+            t0 = time.perf_counter()
+            result = fn(*args, **kwargs)
+            self._prof_accum.setdefault(label, []).append((time.perf_counter() - t0) * 1000)
+            return result
+        return timed
 
     def _prof_flush(self) -> None:
         """Write accumulated profile stats to log every 5 seconds."""
@@ -1399,11 +1966,12 @@ class KTop:
         self._prof_last_flush = now
         if not self._prof_accum:
             return
+        accum, self._prof_accum = self._prof_accum, {}
         lines = [f"\n── frame {self._prof_frame} @ {datetime.now().strftime('%H:%M:%S')} ──\n"]
         lines.append(f"{'Section':<20} {'avg ms':>8} {'max ms':>8} {'calls':>6}\n")
         lines.append(f"{'─' * 20} {'─' * 8} {'─' * 8} {'─' * 6}\n")
         total_avg = 0.0
-        for label, times in sorted(self._prof_accum.items()):
+        for label, times in sorted(accum.items()):
             avg = sum(times) / len(times)
             mx = max(times)
             total_avg += avg
@@ -1412,15 +1980,10 @@ class KTop:
         lines.append(f"{'TOTAL':<20} {total_avg:8.2f}\n")
         with open(self._prof_log, "a") as f:
             f.writelines(lines)
-        self._prof_accum.clear()
 
     # ── main layout ──────────────────────────────────────────────────────
-    def _build(self) -> Layout:
-        if self.picking_theme:
-            return self._theme_picker()
-
-        self._prof_frame += 1
-
+    @staticmethod
+    def _make_layout() -> Layout:
         layout = Layout()
         layout.split_column(
             Layout(name="gpu", ratio=4),
@@ -1438,16 +2001,40 @@ class KTop:
             Layout(name="mem_procs", ratio=1),
             Layout(name="cpu_procs", ratio=1),
         )
+        return layout
+
+    def _update_if_changed(self, name: str, key: tuple, build, *args) -> None:
+        """Rebuild a layout region with build(*args) only when its input key differs from last frame."""
+        if self._last_hashes.get(name) == key:
+            return
+        self._last_hashes[name] = key
+        self._layout[name].update(build(*args))
+        self._frame_changed = True
 
-        self._prof_time("scan_procs", self._scan_procs)
-        layout["gpu"].update(self._prof_time("gpu_panels", self._gpu_panels))
-        layout["net"].update(self._prof_time("net_panel", self._net_panel))
-        layout["cpu"].update(self._prof_time("cpu_panel", self._cpu_panel))
-        layout["mem"].update(self._prof_time("mem_panel", self._mem_panel))
-        layout["mem_procs"].update(self._prof_time("proc_table_mem", lambda: self._proc_table("memory_percent")))
-        layout["cpu_procs"].update(self._prof_time("proc_table_cpu", lambda: self._proc_table("cpu_percent")))
-        layout["temps"].update(self._prof_time("temp_strip", self._temp_strip))
-        layout["status"].update(self._prof_time("status_bar", self._status_bar))
+    def _build(self) -> Layout:
+        if self.picking_theme:
+            return self._theme_picker()
+
+        with self._lock:
+            return self._build_main()
+
+    def _build_main(self) -> Layout:
+        self._prof_frame += 1
+        layout = self._layout
+
+        layout["gpu"].update(self._gpu_panels())
+        layout["net"].update(self._net_panel())
+        layout["cpu"].update(self._cpu_panel())
+        # RAM/swap and temperatures are resampled on slower cadences; between
+        # samples the snapshot carries the same objects forward
+        snap = self._snapshot
+        self._update_if_changed("mem", (self.theme_name, self._term_width, snap.vm, snap.sw), self._mem_panel)
+        # Process tables only change when a new scan lands (every 3s)
+        proc_key = (self._proc_gen, self.theme_name)
+        self._update_if_changed("mem_procs", proc_key, self._proc_table, "memory_percent")
+        self._update_if_changed("cpu_procs", proc_key, self._proc_table, "cpu_percent")
+        self._update_if_changed("temps", (self.theme_name, snap.temps), self._temp_strip)
+        self._update_if_changed("status", (self.theme_name, snap.oom, self._sampler_error), self._status_bar)
 
         self._prof_flush()
         return layout
@@ -1464,8 +2051,7 @@ class KTop:
             if key == "ESC":
                 self.picking_theme = False
             elif key == "ENTER":
-                self.theme_name = THEME_NAMES[self.theme_cursor]
-                self.theme = THEMES[self.theme_name]
+                self._set_theme(THEME_NAMES[self.theme_cursor])
                 self.picking_theme = False
                 _save_config({"theme": self.theme_name})
             elif key == "UP":
@@ -1488,6 +2074,26 @@ class KTop:
     # ── run loop ─────────────────────────────────────────────────────────
     def run(self) -> None:
         def _cleanup():
+            self._stop.set()
+            if self._sampler is not None:
+                self._sampler.join(timeout=1.0)
+                if self._sampler.is_alive():
+                    # Still inside a driver/subprocess call; let process exit tear it down
+                    return
+            _close_amd_fds(self._amd_cards)
+            for sensor in self._hwmon_temps:
+                _close_fd(sensor[1])
+            self._hwmon_temps = []
+            _close_fd(self._net_fd)
+            self._net_fd = None
+            _close_fd(self._freq_fd)
+            self._freq_fd = None
+            if self._sel is not None:
+                self._sel.close()
+                self._sel = None
+            _close_fd(self._wake_w)
+            _close_fd(self._wake_r)
+            self._wake_w = self._wake_r = None
             if self.nvidia_ok:
                 try:
                     nvmlShutdown()
@@ -1498,47 +2104,117 @@ class KTop:
             _cleanup()
             sys.exit(0)
 
+        def _on_resize(*_):
+            self._term_width = self.console.width
+            self._resized = True
+            if self._wake_w is not None:
+                try:
+                    os.write(self._wake_w, b"\0")
+                except BlockingIOError:
+                    pass
+
         signal.signal(signal.SIGINT, _quit)
         signal.signal(signal.SIGTERM, _quit)
+        signal.signal(signal.SIGWINCH, _on_resize)
+        self._term_width = self.console.width
 
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
             tty.setcbreak(fd)
+            # No auto-refresh thread: the loop below refreshes explicitly after each build
             with Live(
                 self._build(),
                 console=self.console,
                 screen=True,
-                refresh_per_second=4,
+                auto_refresh=False,
             ) as live:
-                last_refresh = time.monotonic()
+                # The sampler thread owns the refresh cadence; the UI redraws
+                # whenever it publishes a new snapshot, or on a keypress
+                self._wake_r, self._wake_w = os.pipe()
+                os.set_blocking(self._wake_w, False)
+                # Registered once (epoll on Linux); each wait is then a single syscall
+                self._sel = selectors.DefaultSelector()
+                self._sel.register(fd, selectors.EVENT_READ, "key")
+                self._sel.register(self._wake_r, selectors.EVENT_READ, "wake")
+                self._sampler = threading.Thread(target=self._sampler_loop, name="ktop-sampler", daemon=True)
+                self._sampler.start()
+                self._oom_thread = threading.Thread(target=self._oom_loop, name="ktop-oom", daemon=True)
+                self._oom_thread.start()
+                update = self._timed("rich_render", live.update) if self._prof_log else live.update
+                last_draw = time.monotonic()
                 while True:
-                    # Poll for keys at ~50ms intervals for responsive input
-                    time.sleep(0.05)
-                    key = _read_key()
+                    # Sleep until a key arrives or the sampler publishes a snapshot
+                    key = None
+                    for sk, _ in self._sel.select(REDRAW_INTERVAL):
+                        if sk.data == "wake":
+                            os.read(self._wake_r, 64)
+                        else:
+                            key = _read_key()
                     if self._handle_key(key):
                         break
-                    # Redraw immediately on keypress, or on refresh interval
-                    now = time.monotonic()
-                    if key or now - last_refresh >= self.refresh:
+                    if key or self._resized or self._data_ready.is_set():
+                        self._data_ready.clear()
                         built = self._build()
-                        self._prof_time("rich_render", lambda: live.update(built))
-                        if not key:
-                            last_refresh = now
+                        # On an idle machine most samples draw the same frame: skip
+                        # Rich's render and the terminal write unless something moved
+                        now = time.monotonic()
+                        if (key or self._frame_changed or self._resized
+                                or now - last_draw >= REDRAW_INTERVAL):
+                            self._frame_changed = self._resized = False
+                            last_draw = now
+                            update(built, refresh=True)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
             _cleanup()
 
 
 # ── CLI ──────────────────────────────────────────────────────────────────────
-def main():
+def _parse_args(argv: list[str]) -> SimpleNamespace:
+    """Parse the common flags by hand; defer to argparse for anything else.
+
+    argparse is only imported for --help, --version, abbreviations and
+    malformed input, which keeps it off the path to the first frame.
+    """
+    args = SimpleNamespace(refresh=1.0, theme=None, sim=False)
+    it = iter(argv)
+
+    def value() -> str:
+        # A flag where a value belongs is argparse's to accept or reject
+        v = next(it)
+        if v.startswith("-"):
+            raise ValueError(v)
+        return v
+
+    try:
+        for a in it:
+            if a in ("-r", "--refresh"):
+                args.refresh = float(value())
+            elif a.startswith("--refresh="):
+                args.refresh = float(a.partition("=")[2])
+            elif a == "--theme":
+                args.theme = value()
+            elif a.startswith("--theme="):
+                args.theme = a.partition("=")[2]
+            elif a == "--sim":
+                args.sim = True
+            else:
+                return _argparse_args(argv)
+    except (StopIteration, ValueError):
+        return _argparse_args(argv)
+    return args
+
+
+def _argparse_args(argv: list[str]):
+    import argparse
+
     parser = argparse.ArgumentParser(description="ktop — system monitor for hybrid LLM workloads")
     parser.add_argument(
         "-v", "--version", action="version", version=f"ktop {__version__}",
     )
     parser.add_argument(
         "-r", "--refresh", type=float, default=1.0,
-        help="Refresh interval in seconds (default: 1.0)",
+        help=f"Refresh interval in seconds, sub-second allowed down to {MIN_REFRESH} (default: 1.0)",
     )
     parser.add_argument(
         "--theme", type=str, default=None,
@@ -1548,12 +2224,15 @@ def main():
         "--sim", action="store_true",
         help="Simulation mode (fake OOM kills for testing)",
     )
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def main():
+    args = _parse_args(sys.argv[1:])
 
     k = KTop(refresh=args.refresh, sim=args.sim)
     if args.theme and args.theme in THEMES:
-        k.theme_name = args.theme
-        k.theme = THEMES[args.theme]
+        k._set_theme(args.theme)
     k.run()
 
 